@@ -1,6 +1,7 @@
 import os
 import json
 import logging
+import secrets
 import aiofiles
 
 from homeassistant.config_entries import ConfigEntry
@@ -17,9 +18,11 @@ from .const import (
     SCHEDULE_UPDATED_EVENT,
     SCHEMA_FILE,
     PLATFORMS,
+    CONF_ICS_TOKEN,
 )
 from .services import async_setup_services
 from .coordinator import AIEnergySchedulerCoordinator
+from .ics import ScheduleIcsView
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
@@ -63,6 +66,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady from err
 
     await async_setup_services(hass)
+
+    # secret token used in the ics feed urls, created once per config entry
+    if CONF_ICS_TOKEN not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_ICS_TOKEN: secrets.token_urlsafe(32)}
+        )
+    hass.data[DOMAIN]["ics_token"] = entry.data[CONF_ICS_TOKEN]
+
+    # views can not be unregistered, only register the ics view once
+    if not hass.data[DOMAIN].get("ics_view_registered"):
+        hass.http.register_view(ScheduleIcsView(hass))
+        hass.data[DOMAIN]["ics_view_registered"] = True
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -75,6 +91,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
     hass.data[DOMAIN].pop("coordinator", None)
+    hass.data[DOMAIN].pop("ics_token", None)
     return True
 
 async def async_remove_config_entry_device(hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry) -> bool:
@@ -14,6 +14,7 @@ from homeassistant.exceptions import HomeAssistantError
 
 from .const import DOMAIN, LOGGER_NAME, SCHEDULE_UPDATED_EVENT
 from .entity import AIEnergySchedulerEntity
+from .helpers import interval_uid
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
@@ -76,7 +77,7 @@ class EnergyScheduleCalendar(AIEnergySchedulerEntity, CalendarEntity):
                     end=interval.end,
                     summary=interval.command if not interval.command_override else interval.command_override,
                     description=f"Generated by AI, suggested command: {interval.command}",
-                    uid=f"{self._device_id}-{interval.start.isoformat()}-{interval.end.isoformat()}"
+                    uid=interval_uid(self._device_id, interval)
                 ))
         return events
 
@@ -94,7 +95,7 @@ class EnergyScheduleCalendar(AIEnergySchedulerEntity, CalendarEntity):
             summary=interval.command if not interval.command_override else interval.command_override,
             description=f"Generated by AI, suggested command: {interval.command}",
             #uid=f"{self._device_id}-{interval.start.isoformat()}"
-            uid=f"{self._device_id}-{interval.start.isoformat()}-{interval.end.isoformat()}"
+            uid=interval_uid(self._device_id, interval)
         )
 
     # async def async_handle_event(self, event):
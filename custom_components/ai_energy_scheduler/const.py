@@ -2,6 +2,8 @@ DOMAIN = "ai_energy_scheduler"
 LOGGER_NAME = "ai_energy_scheduler"
 
 SERVICE_SET_SCHEDULE = "set_schedule"
+SERVICE_GET_ICS_URLS = "get_ics_urls"
+SERVICE_REGENERATE_ICS_TOKEN = "regenerate_ics_token"
 
 STORAGE_KEY = f"{DOMAIN}_store"
 STORAGE_VERSION = 1
@@ -11,4 +13,8 @@ SCHEMA_FILE = "schema.json"
 SCHEDULE_UPDATED_EVENT = f"{DOMAIN}_schedule_updated"
 # CALENDAR_OVERRIDE_EVENT = f"{DOMAIN}_calendar_override"
 
+CONF_ICS_TOKEN = "ics_token"
+ICS_URL = f"/api/{DOMAIN}/ics/{{token}}"
+ICS_DEVICE_URL = f"{ICS_URL}/{{device_id}}"
+
 PLATFORMS = ["sensor", "calendar"]
\ No newline at end of file
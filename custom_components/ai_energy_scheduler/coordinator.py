@@ -1,7 +1,9 @@
+import hashlib
 import logging
 import os
 import json
-from typing import Any, Dict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
 
 import jsonschema
 # import aiofiles
@@ -22,6 +24,15 @@ class AIEnergySchedulerCoordinator(DataUpdateCoordinator):
         self.data = initial_data
         self.schema = schema
 
+        # per device schedule versions, bumped whenever a device schedule changes
+        self.schedule_versions: Dict[str, int] = {}
+        # per device content digests and bump times, stable across restarts for the same schedule
+        self.schedule_digests: Dict[str, str] = {}
+        self.schedule_updated: Dict[str, datetime] = {}
+        self._schedule_fingerprints: Dict[str, str] = {}
+        self._schedule_revision = 0
+        self._refresh_schedule_versions()
+
     @property
     def device_ids(self):
         return list(self.data.get("schedules", {}).keys())
@@ -29,6 +40,43 @@ class AIEnergySchedulerCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self) -> dict:
         return self.data
 
+    @staticmethod
+    def _fingerprint_schedules(data: dict) -> Dict[str, str]:
+        """Return a fingerprint per device of the interval fields rendered in the calendar feed."""
+        schedules = (data or {}).get("schedules", {})
+        return {
+            device_id: json.dumps(
+                [
+                    [
+                        interval.get("start"),
+                        interval.get("end"),
+                        interval.get("command"),
+                        interval.get("command_override"),
+                    ]
+                    for interval in schedule.get("intervals", [])
+                ],
+                default=str,
+            )
+            for device_id, schedule in schedules.items()
+        }
+
+    def _refresh_schedule_versions(self, fingerprints: Optional[Dict[str, str]] = None) -> None:
+        """Bump the version of every device whose schedule changed since the last refresh."""
+        if fingerprints is None:
+            fingerprints = self._fingerprint_schedules(self.data)
+        now = datetime.now(timezone.utc)
+        for device_id, fingerprint in fingerprints.items():
+            if self._schedule_fingerprints.get(device_id) != fingerprint:
+                self._schedule_revision += 1
+                self.schedule_versions[device_id] = self._schedule_revision
+                self.schedule_digests[device_id] = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+                self.schedule_updated[device_id] = now
+        for device_id in set(self.schedule_versions) - set(fingerprints):
+            self.schedule_versions.pop(device_id)
+            self.schedule_digests.pop(device_id)
+            self.schedule_updated.pop(device_id)
+        self._schedule_fingerprints = fingerprints
+
     async def async_update_schedule(self, new_data: dict) -> None:
         # validate schedule data against schema
         try:
@@ -37,7 +85,9 @@ class AIEnergySchedulerCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Schema validation failed: %s", err, exc_info=True)
             raise UpdateFailed(f"Invalid schedule: {err}")
 
+        fingerprints = self._fingerprint_schedules(new_data)
         self.data = new_data
+        self._refresh_schedule_versions(fingerprints)
         try:
             await self.store.async_save(self.data)
         except Exception:
@@ -53,6 +103,7 @@ class AIEnergySchedulerCoordinator(DataUpdateCoordinator):
         except KeyError as err:
             _LOGGER.error(f"Invalid interval id: {err}", exc_info=True)
             raise UpdateFailed(f"Invalid interval id: {err}")
+        self._refresh_schedule_versions()
 
         # update the data in the store
         try:
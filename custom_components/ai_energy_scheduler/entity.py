@@ -6,7 +6,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN,LOGGER_NAME
-from .helpers import Intervals
+from .helpers import parse_intervals
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
@@ -47,27 +47,7 @@ class AIEnergySchedulerEntity(CoordinatorEntity):
         elif not schedules.get("intervals", []):
             _LOGGER.debug(f"No intervals found for device {self._device_id}")
         else:
-            intervals = []
-            for interval in schedules.get("intervals"):
-                try:
-                    start = datetime.fromisoformat(interval.get("start"))
-                    end = datetime.fromisoformat(interval.get("end"))
-                    cmd = interval.get("command")
-                    cmd_override = interval.get("command_override", None)
-
-                    intervals.append(Intervals(
-                        start = start,
-                        end = end,
-                        command = cmd,
-                        command_override = cmd_override,
-                        power_kw = interval.get("power_kw", 0),
-                        energy_kwh = interval.get("energy_kwh", 0),
-                        source = interval.get("source", "ai")
-                    ))
-                except (ValueError) as e:
-                    _LOGGER.error(f"Error parsing interval for device {self._device_id}: {e}")
-                    continue
-            return intervals
+            return parse_intervals(self._device_id, schedules)
         # return empty list if no intervals found
         return []
     
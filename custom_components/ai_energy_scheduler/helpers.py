@@ -1,5 +1,11 @@
+import logging
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
+
+from .const import LOGGER_NAME
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
 
 @dataclass
 class Intervals:
@@ -11,3 +17,28 @@ class Intervals:
     energy_kwh: float | None = None
     source: str | None = "ai"
     command_override: Optional[str] = None
+
+
+def parse_intervals(device_id: str, schedule: dict) -> List[Intervals]:
+    """Parse the raw intervals of a device schedule, skipping invalid ones."""
+    intervals = []
+    for interval in schedule.get("intervals", []):
+        try:
+            intervals.append(Intervals(
+                start = datetime.fromisoformat(interval.get("start")),
+                end = datetime.fromisoformat(interval.get("end")),
+                command = interval.get("command"),
+                command_override = interval.get("command_override", None),
+                power_kw = interval.get("power_kw", 0),
+                energy_kwh = interval.get("energy_kwh", 0),
+                source = interval.get("source", "ai")
+            ))
+        except (ValueError) as e:
+            _LOGGER.error(f"Error parsing interval for device {device_id}: {e}")
+            continue
+    return intervals
+
+
+def interval_uid(device_id: str, interval: Intervals) -> str:
+    """Return the calendar event uid for an interval."""
+    return f"{device_id}-{interval.start.isoformat()}-{interval.end.isoformat()}"
@@ -0,0 +1,202 @@
+import hashlib
+import hmac
+import logging
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, LOGGER_NAME, ICS_URL, ICS_DEVICE_URL
+from .coordinator import AIEnergySchedulerCoordinator
+from .helpers import Intervals, interval_uid, parse_intervals
+
+_LOGGER = logging.getLogger(LOGGER_NAME)
+
+ICS_CONTENT_TYPE = "text/calendar"
+ICS_PRODID = "-//AI Energy Scheduler//EN"
+
+
+def _escape_text(value: str) -> str:
+    """Escape a TEXT value according to RFC 5545."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold_line(line: str) -> str:
+    """Fold a content line at 75 octets according to RFC 5545."""
+    if len(line.encode("utf-8")) <= 75:
+        return line
+    parts = []
+    current = ""
+    limit = 75
+    for char in line:
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = char
+            # continuation lines start with a space
+            limit = 74
+        else:
+            current += char
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def _format_datetime(value: datetime) -> str:
+    """Format a datetime as UTC, or as floating time if it has no timezone."""
+    if value.tzinfo is None:
+        return value.strftime("%Y%m%dT%H%M%S")
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_device_events(device_id: str, intervals: List[Intervals], dtstamp: datetime) -> str:
+    """Render the VEVENT blocks for a device, using the same uids as the calendar entity."""
+    lines = []
+    for interval in intervals:
+        summary = interval.command if not interval.command_override else interval.command_override
+        lines.extend([
+            "BEGIN:VEVENT",
+            f"UID:{_escape_text(interval_uid(device_id, interval))}",
+            f"DTSTAMP:{_format_datetime(dtstamp)}",
+            f"DTSTART:{_format_datetime(interval.start)}",
+            f"DTEND:{_format_datetime(interval.end)}",
+            f"SUMMARY:{_escape_text(summary)}",
+            f"DESCRIPTION:{_escape_text(f'Generated by AI, suggested command: {interval.command}')}",
+            f"CATEGORIES:{_escape_text(device_id)}",
+            "END:VEVENT",
+        ])
+    return "".join(f"{_fold_line(line)}\r\n" for line in lines)
+
+
+def render_calendar(name: str, events: List[str]) -> bytes:
+    """Wrap rendered VEVENT blocks in a VCALENDAR."""
+    header = "".join(f"{_fold_line(line)}\r\n" for line in [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{ICS_PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape_text(name)}",
+    ])
+    return (header + "".join(events) + "END:VCALENDAR\r\n").encode("utf-8")
+
+
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    """Return True if the If-None-Match header of the request matches the etag."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # If-None-Match uses the weak comparison function
+        if candidate.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
+
+
+class ScheduleIcsView(HomeAssistantView):
+    """Serve the schedules as iCalendar feeds, one per device and one for all devices.
+
+    Calendar clients can not send bearer tokens, so the feed is authenticated by the
+    secret token of the config entry in the url instead of by Home Assistant auth.
+    """
+
+    requires_auth = False
+    url = ICS_URL
+    extra_urls = [ICS_DEVICE_URL]
+    name = f"api:{DOMAIN}:ics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._coordinator = None
+        # device_id -> (schedule version, rendered VEVENT blocks)
+        self._events: Dict[str, Tuple[int, str]] = {}
+        # feed key -> (etag, rendered feed)
+        self._feeds: Dict[str, Tuple[str, bytes]] = {}
+
+    def _device_events(self, device_id: str, version: int) -> str:
+        """Return the rendered events for a device, regenerating them only if its version changed."""
+        cached = self._events.get(device_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        _LOGGER.debug(f"Rendering ics events for device {device_id} (version {version})")
+        schedule = self._coordinator.data.get("schedules", {}).get(device_id, {})
+        events = render_device_events(
+            device_id,
+            parse_intervals(device_id, schedule),
+            self._coordinator.schedule_updated[device_id],
+        )
+        self._events[device_id] = (version, events)
+        return events
+
+    def _sync_coordinator(self) -> Optional[AIEnergySchedulerCoordinator]:
+        """Return the current coordinator, dropping the cache if it was replaced."""
+        coordinator = self.hass.data.get(DOMAIN, {}).get("coordinator")
+        if coordinator is not self._coordinator:
+            # versions restart with a new coordinator, cached renders are no longer valid
+            self._coordinator = coordinator
+            self._events.clear()
+            self._feeds.clear()
+        return coordinator
+
+    async def get(self, request: web.Request, token: str, device_id: Optional[str] = None) -> web.Response:
+        """Return the ics feed for one device, or for all devices if no device is given."""
+        ics_token = self.hass.data.get(DOMAIN, {}).get("ics_token")
+        if not ics_token or not hmac.compare_digest(token.encode("utf-8"), ics_token.encode("utf-8")):
+            return self.json_message("Invalid token", HTTPStatus.UNAUTHORIZED)
+
+        coordinator = self._sync_coordinator()
+        if coordinator is None:
+            return self.json_message("Coordinator not found", HTTPStatus.SERVICE_UNAVAILABLE)
+
+        versions = coordinator.schedule_versions
+        for removed in set(self._events) - set(versions):
+            self._events.pop(removed)
+            self._feeds.pop(removed, None)
+
+        if device_id is None:
+            device_ids = sorted(versions)
+            feed_key = ""
+            name = "AI Energy Scheduler"
+        elif device_id in versions:
+            device_ids = [device_id]
+            feed_key = device_id
+            name = f"AI {device_id}"
+        else:
+            return self.json_message(f"Unknown device: {device_id}", HTTPStatus.NOT_FOUND)
+
+        # the etag only depends on the schedule contents, so conditional requests never render
+        # anything and stay valid across restarts. It is weak since DTSTAMP may differ between
+        # renders of the same schedule.
+        digests = coordinator.schedule_digests
+        state = ";".join(f"{dev}:{digests[dev]}" for dev in device_ids)
+        etag = f'W/"{hashlib.sha1(state.encode("utf-8")).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if _etag_matches(request, etag):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        cached = self._feeds.get(feed_key)
+        if cached is None or cached[0] != etag:
+            body = render_calendar(name, [self._device_events(dev, versions[dev]) for dev in device_ids])
+            cached = (etag, body)
+            self._feeds[feed_key] = cached
+
+        return web.Response(
+            body=cached[1],
+            content_type=ICS_CONTENT_TYPE,
+            charset="utf-8",
+            headers=headers,
+        )
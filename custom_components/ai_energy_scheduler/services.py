@@ -1,11 +1,23 @@
 import json
 import logging
+import secrets
 from typing import Any, Dict, Union
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.network import NoURLAvailableError, get_url
+from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN, SERVICE_SET_SCHEDULE, LOGGER_NAME
+from .const import (
+    DOMAIN,
+    SERVICE_SET_SCHEDULE,
+    SERVICE_GET_ICS_URLS,
+    SERVICE_REGENERATE_ICS_TOKEN,
+    LOGGER_NAME,
+    CONF_ICS_TOKEN,
+    ICS_URL,
+    ICS_DEVICE_URL,
+)
 
 _LOGGER = logging.getLogger(LOGGER_NAME)
 
@@ -44,6 +56,43 @@ async def handle_set_schedule(call: ServiceCall) -> None:
         _LOGGER.error("Failed to update schedule: %s", err)
         raise HomeAssistantError(f"Failed to update schedule: {err}") from err
 
+async def handle_get_ics_urls(call: ServiceCall) -> ServiceResponse:
+    hass: HomeAssistant = call.hass
+    coordinator = hass.data.get(DOMAIN, {}).get("coordinator")
+    token = hass.data.get(DOMAIN, {}).get("ics_token")
+    if coordinator is None or not token:
+        raise HomeAssistantError("Coordinator not found")
+
+    try:
+        base_url = get_url(hass)
+    except NoURLAvailableError as err:
+        raise HomeAssistantError("No Home Assistant url configured") from err
+
+    return {
+        "all": base_url + ICS_URL.format(token=token),
+        "devices": {
+            device_id: base_url + ICS_DEVICE_URL.format(token=token, device_id=device_id)
+            for device_id in coordinator.device_ids
+        },
+    }
+
+async def handle_regenerate_ics_token(call: ServiceCall) -> None:
+    hass: HomeAssistant = call.hass
+    entries = hass.config_entries.async_entries(DOMAIN)
+    if not entries:
+        raise HomeAssistantError("Config entry not found")
+
+    # replacing the token revokes every previously shared feed url
+    token = secrets.token_urlsafe(32)
+    hass.config_entries.async_update_entry(entries[0], data={**entries[0].data, CONF_ICS_TOKEN: token})
+    hass.data.setdefault(DOMAIN, {})["ics_token"] = token
+    _LOGGER.info("Regenerated ics feed token, previous feed urls are no longer valid")
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Register custom services."""
     hass.services.async_register(DOMAIN, SERVICE_SET_SCHEDULE, handle_set_schedule)
+    # the ics feed urls contain a secret token, only admins may read or rotate it
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_GET_ICS_URLS, handle_get_ics_urls, supports_response=SupportsResponse.ONLY
+    )
+    async_register_admin_service(hass, DOMAIN, SERVICE_REGENERATE_ICS_TOKEN, handle_regenerate_ics_token)
@@ -0,0 +1,203 @@
+import asyncio
+import copy
+import json
+import os
+from datetime import datetime, timezone
+from http import HTTPStatus
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.ai_energy_scheduler.const import DOMAIN, CONF_ICS_TOKEN, SCHEMA_FILE
+from custom_components.ai_energy_scheduler.coordinator import AIEnergySchedulerCoordinator
+from custom_components.ai_energy_scheduler.helpers import parse_intervals
+from custom_components.ai_energy_scheduler.ics import (
+    ScheduleIcsView,
+    _escape_text,
+    _fold_line,
+    render_device_events,
+)
+from custom_components.ai_energy_scheduler.services import (
+    handle_get_ics_urls,
+    handle_regenerate_ics_token,
+)
+
+TOKEN = "secret-token"
+
+with open(
+    os.path.join(os.path.dirname(__file__), "..", "custom_components", "ai_energy_scheduler", SCHEMA_FILE),
+    encoding="utf-8",
+) as _file:
+    SCHEMA = json.load(_file)
+
+
+def _interval(command, start="2025-06-01T10:00:00+02:00", end="2025-06-01T11:00:00+02:00"):
+    return {"start": start, "end": end, "command": command, "power_kw": 1.0}
+
+
+def _data(**commands):
+    return {"schedules": {dev: {"intervals": [_interval(cmd)]} for dev, cmd in commands.items()}}
+
+
+def _coordinator(hass, data):
+    store = MagicMock()
+    store.async_save = AsyncMock()
+    return AIEnergySchedulerCoordinator(hass, store, data, schema=SCHEMA)
+
+
+@pytest.fixture
+def hass():
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"ics_token": TOKEN}}
+    hass.config.external_url = "https://ha.example"
+    return hass
+
+
+def _get(view, device_id=None, if_none_match=None, token=TOKEN):
+    headers = {"If-None-Match": if_none_match} if if_none_match else {}
+    return asyncio.run(view.get(SimpleNamespace(headers=headers), token, device_id))
+
+
+def test_escape_text():
+    assert _escape_text("a\\b;c,d\ne\r\nf") == "a\\\\b\\;c\\,d\\ne\\nf"
+
+
+def test_fold_line():
+    assert _fold_line("SUMMARY:short") == "SUMMARY:short"
+
+    line = "DESCRIPTION:" + "å" * 80
+    folded = _fold_line(line)
+    parts = folded.split("\r\n")
+    assert len(parts) > 1
+    assert all(len(part.encode("utf-8")) <= 75 for part in parts)
+    assert all(part.startswith(" ") for part in parts[1:])
+    assert "".join(part[1:] if i else part for i, part in enumerate(parts)) == line
+
+
+def test_render_device_events_uses_calendar_uid():
+    intervals = parse_intervals("hp", {"intervals": [_interval("on")]})
+    events = render_device_events("hp", intervals, datetime(2025, 1, 1, tzinfo=timezone.utc))
+    assert "UID:hp-2025-06-01T10:00:00+02:00-2025-06-01T11:00:00+02:00\r\n" in events
+    assert "DTSTART:20250601T080000Z\r\n" in events
+    assert "DTSTAMP:20250101T000000Z\r\n" in events
+
+
+def test_refresh_schedule_versions(hass):
+    coordinator = _coordinator(hass, _data(a="charge", b="idle"))
+    versions = dict(coordinator.schedule_versions)
+
+    asyncio.run(coordinator.async_update_schedule(_data(a="discharge", b="idle")))
+    assert coordinator.schedule_versions["a"] > versions["a"]
+    assert coordinator.schedule_versions["b"] == versions["b"]
+
+    # in place mutation, as done when removing a device
+    coordinator.data["schedules"].pop("b")
+    asyncio.run(coordinator.async_update_schedule(coordinator.data))
+    assert set(coordinator.schedule_versions) == {"a"}
+    assert set(coordinator.schedule_digests) == {"a"}
+
+
+def test_unrendered_fields_do_not_bump_versions(hass):
+    coordinator = _coordinator(hass, _data(a="charge"))
+    version = coordinator.schedule_versions["a"]
+    digest = coordinator.schedule_digests["a"]
+
+    data = _data(a="charge")
+    data["schedules"]["a"]["intervals"][0].update(power_kw=5.0, energy_kwh=2.0, source="manual", description="x")
+    asyncio.run(coordinator.async_update_schedule(data))
+    assert coordinator.schedule_versions["a"] == version
+    assert coordinator.schedule_digests["a"] == digest
+
+    asyncio.run(coordinator.async_override_device_interval("a", 0, "discharge"))
+    assert coordinator.schedule_versions["a"] > version
+
+
+def test_invalid_schedule_leaves_state_untouched(hass):
+    coordinator = _coordinator(hass, _data(a="charge"))
+    data = coordinator.data
+    versions = dict(coordinator.schedule_versions)
+
+    invalid = _data(a="charge")
+    invalid["schedules"]["a"]["intervals"][0]["power_kw"] = "a lot"
+    with pytest.raises(UpdateFailed):
+        asyncio.run(coordinator.async_update_schedule(invalid))
+    assert coordinator.data is data
+    assert coordinator.schedule_versions == versions
+
+
+def test_view_renders_only_changed_devices(hass):
+    coordinator = _coordinator(hass, _data(a="charge", b="idle"))
+    hass.data[DOMAIN]["coordinator"] = coordinator
+    view = ScheduleIcsView(hass)
+
+    assert _get(view).status == HTTPStatus.OK
+    cached_b = view._events["b"]
+
+    asyncio.run(coordinator.async_update_schedule(_data(a="discharge", b="idle")))
+    response = _get(view)
+    assert b"SUMMARY:discharge" in response.body
+    assert view._events["b"] is cached_b
+
+
+def test_view_conditional_requests(hass):
+    hass.data[DOMAIN]["coordinator"] = _coordinator(hass, _data(a="charge"))
+    view = ScheduleIcsView(hass)
+
+    etag = _get(view, "a").headers["ETag"]
+    assert _get(view, "a", if_none_match=etag).status == HTTPStatus.NOT_MODIFIED
+    assert _get(view, "a", if_none_match=etag.removeprefix("W/")).status == HTTPStatus.NOT_MODIFIED
+    assert _get(view, "a", if_none_match=f'"other", {etag}').status == HTTPStatus.NOT_MODIFIED
+    assert _get(view, "a", if_none_match="*").status == HTTPStatus.NOT_MODIFIED
+    assert _get(view, "a", if_none_match='"other"').status == HTTPStatus.OK
+
+
+def test_view_unknown_device_and_invalid_token(hass):
+    hass.data[DOMAIN]["coordinator"] = _coordinator(hass, _data(a="charge"))
+    view = ScheduleIcsView(hass)
+
+    assert _get(view, "missing").status == HTTPStatus.NOT_FOUND
+    assert _get(view, "a", token="wrong").status == HTTPStatus.UNAUTHORIZED
+
+
+def test_etag_not_reused_after_restart(hass):
+    coordinator = _coordinator(hass, _data(a="charge"))
+    hass.data[DOMAIN]["coordinator"] = coordinator
+    view = ScheduleIcsView(hass)
+    boot_etag = _get(view, "a").headers["ETag"]
+
+    asyncio.run(coordinator.async_update_schedule(_data(a="discharge")))
+    changed_etag = _get(view, "a").headers["ETag"]
+
+    # a restarted coordinator starts counting versions from scratch again
+    hass.data[DOMAIN]["coordinator"] = _coordinator(hass, copy.deepcopy(coordinator.data))
+    response = _get(view, "a", if_none_match=boot_etag)
+    assert response.status == HTTPStatus.OK
+    assert b"SUMMARY:discharge" in response.body
+    assert _get(view, "a", if_none_match=changed_etag).status == HTTPStatus.NOT_MODIFIED
+
+
+def test_get_ics_urls(hass):
+    hass.data[DOMAIN]["coordinator"] = _coordinator(hass, _data(a="charge"))
+
+    urls = asyncio.run(handle_get_ics_urls(SimpleNamespace(hass=hass)))
+    assert urls == {
+        "all": f"https://ha.example/api/{DOMAIN}/ics/{TOKEN}",
+        "devices": {"a": f"https://ha.example/api/{DOMAIN}/ics/{TOKEN}/a"},
+    }
+
+
+def test_regenerate_ics_token_revokes_old_urls(hass):
+    hass.data[DOMAIN]["coordinator"] = _coordinator(hass, _data(a="charge"))
+    entry = SimpleNamespace(data={CONF_ICS_TOKEN: TOKEN})
+    hass.config_entries.async_entries.return_value = [entry]
+    view = ScheduleIcsView(hass)
+
+    asyncio.run(handle_regenerate_ics_token(SimpleNamespace(hass=hass)))
+    new_token = hass.data[DOMAIN]["ics_token"]
+    assert new_token != TOKEN
+    hass.config_entries.async_update_entry.assert_called_once_with(entry, data={CONF_ICS_TOKEN: new_token})
+    assert _get(view, "a").status == HTTPStatus.UNAUTHORIZED
+    assert _get(view, "a", token=new_token).status == HTTPStatus.OK